@@ -457,7 +457,6 @@ if __name__ == '__main__':
     test_forward_yolo_op()
     test_forward_upsample()
     test_forward_elu()
-    test_forward_rnn()
     test_forward_crnn()
     test_forward_lstm()
     test_forward_gru()